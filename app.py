@@ -1,82 +1,266 @@
 import streamlit as st
+import numpy as np
 import pandas as pd
 import plotly.express as px
-import plotly.graph_objects as go 
+import plotly.graph_objects as go
 import calendar
 
+from common import load_data, sidebar_filters, get_filtered_df
+
 
 st.set_page_config(layout="wide", page_title="Netflix Analysis Dashboard")
 
-#Data Loading 
+data_bundle = load_data()
+countries_long = data_bundle['countries_long']
+
+
+# Cached per-chart aggregations, keyed on the (hashable) widget state so
+# reruns with an unchanged filter reuse the stored result instead of
+# recomputing the whole pipeline.
 @st.cache_data
-def load_data(filepath):
-    try:
-        data = pd.read_csv(filepath)
-        # Data Cleaning
-        data['country'] = data['country'].fillna('Unknown')
-        data['director'] = data['director'].fillna('Unknown')
-        data['cast'] = data['cast'].fillna('Unknown')
-        data = data.dropna(subset=['rating', 'date_added', 'duration'])
-        
-        # Convert date_added to datetime objects for time-based plots
-        data['date_added'] = pd.to_datetime(data['date_added'], format='mixed')
-        return data
-    except FileNotFoundError:
-        st.error(f"Error: The file '{filepath}' was not found. Please make sure it's in the root of your GitHub repository.")
+def compute_genre_rating_counts(types, ratings, years):
+    filtered_df = get_filtered_df(types, ratings, years)
+
+    # No dropna pass needed: value_counts and groupby both skip missing
+    # main_genre rows, and rating has no NaNs after load_data's cleaning.
+    top_10_genres = filtered_df['main_genre'].value_counts().head(10).index.tolist()
+    top_genres_df = filtered_df[filtered_df['main_genre'].isin(top_10_genres)]
+
+    # observed=True groups on category codes and only emits combinations
+    # that actually occur; the chart sorts by total, so no sorted output
+    # is needed here either.
+    return top_genres_df.groupby(['main_genre', 'rating'], observed=True, sort=False).size().reset_index(name='count')
+
+@st.cache_data
+def compute_heatmap_pivot(types, ratings, years):
+    heatmap_data = get_filtered_df(types, ratings, years)
+
+    # One crosstab pass over the precomputed int columns replaces the old
+    # groupby + pivot + fillna chain, and the int keys come out already in
+    # calendar order - just relabel the columns with month names.
+    heatmap_pivot = pd.crosstab(heatmap_data['year_added'], heatmap_data['month_added'])
+    heatmap_pivot.columns = [calendar.month_name[m] for m in heatmap_pivot.columns]
+    return heatmap_pivot
+
+@st.cache_data
+def compute_country_counts(types, ratings, years):
+    filtered_df = get_filtered_df(types, ratings, years)
+    country_data = countries_long.loc[countries_long.index.isin(filtered_df.index), 'country']
+
+    country_data_no_usa = country_data[(country_data != 'United States') & (country_data != 'Unknown')]
+    if country_data_no_usa.empty:
+        return pd.DataFrame(columns=['Country', 'Count'])
+
+    # Unsorted hash-grouped counts + nlargest: a partial selection of the
+    # top 10 instead of fully sorting every country's count.
+    return (
+        country_data_no_usa.groupby(country_data_no_usa, sort=False).size()
+        .nlargest(10)
+        .rename_axis('Country').reset_index(name='Count')
+    )
+
+@st.cache_data
+def compute_rating_counts(types, ratings, years):
+    rating_counts = get_filtered_df(types, ratings, years)['rating'].value_counts().reset_index()
+    rating_counts.columns = ['rating', 'count']
+    return rating_counts
+
+@st.cache_data
+def compute_runtime_box_stats(types, ratings, years):
+    filtered_df = get_filtered_df(types, ratings, years)
+    # No mutation happens below (the stats come from a groupby), so a plain
+    # selection is enough - no defensive .copy() of the full frame. Rows
+    # with missing main_genre fall out of the groupby on their own.
+    # duration_min is only set for 'X min' durations, so notna() replaces
+    # the old substring scan over the raw duration strings.
+    movie_mask = (
+        (filtered_df['type'].to_numpy() == 'Movie') &
+        filtered_df['duration_min'].notna().to_numpy(dtype=bool)
+    )
+    box_data = filtered_df.iloc[movie_mask]
+    if box_data.empty:
         return pd.DataFrame()
 
-df = load_data('netflix_titles.csv')
+    # Get top 10 genres
+    top_10_genres_box = box_data['main_genre'].value_counts().head(10).index.tolist()
+    box_data = box_data[box_data['main_genre'].isin(top_10_genres_box)]
+
+    # Precompute the box statistics per genre so the figure ships ~7 numbers
+    # per box instead of every raw duration value.
+    stats = box_data.groupby('main_genre')['duration_min'].agg(
+        count='count',
+        low='min',
+        q1=lambda s: s.quantile(0.25),
+        median='median',
+        q3=lambda s: s.quantile(0.75),
+        high='max',
+    ).astype(float)
+    iqr = stats['q3'] - stats['q1']
+    stats['lowerfence'] = np.maximum(stats['low'], stats['q1'] - 1.5 * iqr)
+    stats['upperfence'] = np.minimum(stats['high'], stats['q3'] + 1.5 * iqr)
+    return stats.sort_values('count', ascending=False).reset_index()
+
+
+# Each chart lives in its own fragment, so widget interaction inside one
+# chart reruns just that fragment instead of rebuilding the whole page.
+# Keyed st.plotly_chart calls let the frontend diff figure data in place.
+@st.fragment
+def chart_top_genres(types, ratings, years):
+    # Plot 1
+    st.markdown("**Plot 1: Top 10 Genres by Rating**")
+
+    genre_rating_counts = compute_genre_rating_counts(types, ratings, years)
+
+    if not genre_rating_counts.empty:
+        fig1 = px.bar(
+            genre_rating_counts,
+            x='main_genre',
+            y='count',
+            color='rating',
+            title="Rating Breakdown for Top 10 Genres",
+            barmode='stack'
+        )
+        fig1.update_layout(xaxis_title="Genre", yaxis_title="Total Count",
+                           xaxis={'categoryorder':'total descending'})
+        st.plotly_chart(fig1, use_container_width=True, key="top_genres")
+    else:
+        st.info("No data for Genre/Rating chart.")
+
+@st.cache_resource
+def static_export_available():
+    # kaleido needs a Chrome binary at runtime, which not every deploy
+    # target has (e.g. stock Streamlit Cloud images). Probe once and fall
+    # back to interactive charts when static export can't work.
+    try:
+        go.Figure().to_image(format='png', width=10, height=10)
+        return True
+    except Exception:
+        return False
+
+def build_heatmap_fig(heatmap_pivot):
+    fig2 = go.Figure(data=go.Heatmap(
+        z=heatmap_pivot.values,
+        x=heatmap_pivot.columns,
+        y=heatmap_pivot.index,
+        colorscale='Reds'
+    ))
+    fig2.update_layout(title="Monthly Content Additions Over Time",
+                       xaxis_title="Month",
+                       yaxis_title="Year")
+    return fig2
+
+@st.cache_data
+def render_heatmap_png(types, ratings, years):
+    # A static PNG is a few tens of KB versus the figure JSON plus a
+    # plotly.js instance per figure; hover isn't essential on this chart.
+    fig2 = build_heatmap_fig(compute_heatmap_pivot(types, ratings, years))
+    return fig2.to_image(format='png', width=700, height=400)
+
+@st.fragment
+def chart_heatmap(types, ratings, years):
+    # Plot 2
+    st.markdown("**Plot 2: Content Addition Heatmap (by Year & Month)**")
+    heatmap_pivot = compute_heatmap_pivot(types, ratings, years)
+
+    if heatmap_pivot.empty:
+        st.info("No data for Heatmap.")
+    elif static_export_available():
+        st.image(render_heatmap_png(types, ratings, years), use_container_width=True)
+    else:
+        st.plotly_chart(build_heatmap_fig(heatmap_pivot), use_container_width=True, key="heatmap")
+
+@st.fragment
+def chart_top_countries(types, ratings, years):
+    # Plot 3
+    st.markdown("**Plot 3: Top 10 Production Countries (Excl. USA)**")
+    country_counts = compute_country_counts(types, ratings, years)
+
+    if not country_counts.empty:
+        fig3 = px.bar(
+            country_counts,
+            x='Count',
+            y='Country',
+            orientation='h',
+            title="Top 10 Production Countries (Excluding United States)"
+        )
+        fig3.update_layout(yaxis={'categoryorder':'total ascending'})
+        st.plotly_chart(fig3, use_container_width=True, key="top_countries")
+    else:
+        st.info("No non-USA country data to display.")
+
+def build_rating_fig(rating_counts):
+    return px.pie(
+        rating_counts,
+        names='rating',
+        values='count',
+        title="Overall Rating Distribution",
+        hole=0.3
+    )
+
+@st.cache_data
+def render_rating_png(types, ratings, years):
+    fig4 = build_rating_fig(compute_rating_counts(types, ratings, years))
+    return fig4.to_image(format='png', width=700, height=400)
+
+@st.fragment
+def chart_rating_distribution(types, ratings, years):
+    #Plot 4
+    st.markdown("**Plot 4: Overall Rating Distribution**")
+
+    rating_counts = compute_rating_counts(types, ratings, years)
+
+    if rating_counts.empty:
+        st.info("No rating data to display.")
+    elif static_export_available():
+        st.image(render_rating_png(types, ratings, years), use_container_width=True)
+    else:
+        st.plotly_chart(build_rating_fig(rating_counts), use_container_width=True, key="rating_distribution")
+
+@st.fragment
+def chart_runtime_box(types, ratings, years):
+    # Plot 5
+    st.markdown("**Plot 5: Movie Runtime Distribution by Genre**")
+
+    box_stats = compute_runtime_box_stats(types, ratings, years)
+
+    if not box_stats.empty:
+        fig5 = go.Figure(go.Box(
+            x=box_stats['main_genre'],
+            q1=box_stats['q1'],
+            median=box_stats['median'],
+            q3=box_stats['q3'],
+            lowerfence=box_stats['lowerfence'],
+            upperfence=box_stats['upperfence'],
+        ))
+        fig5.update_layout(title="Movie Runtime Distributions by Top 10 Genres",
+                           xaxis_title="Genre", yaxis_title="Duration (Minutes)",
+                           showlegend=False)
+        st.plotly_chart(fig5, use_container_width=True, key="runtime_box")
+    else:
+        st.info("No valid movie runtime data to display.")
+
 
 st.title("A Data-Driven Analysis of Netflix")
 st.markdown("This dashboard provides an interactive analysis of Netflix content, solving the 'decision fatigue' problem identified in the project background.")
 
-st.sidebar.header("Dashboard Filters")
-
-# Filter 1
-type_options = df['type'].unique()
-type_filter = st.sidebar.multiselect(
-    "Select Content Type (Movie/TV Show):",
-    options=type_options,
-    default=type_options
-)
-
-# Filter 2
-rating_options = sorted(df['rating'].unique())
-rating_filter = st.sidebar.multiselect(
-    "Select Content Rating:",
-    options=rating_options,
-    default=rating_options
-)
-
-# Filter 3
-min_year = int(df['release_year'].min())
-max_year = int(df['release_year'].max())
-year_slider = st.sidebar.slider(
-    "Select Release Year Range:",
-    min_value=min_year,
-    max_value=max_year,
-    value=(min_year, max_year)
-)
-
-
-filtered_df = df[
-    (df['type'].isin(type_filter)) &
-    (df['rating'].isin(rating_filter)) &
-    (df['release_year'] >= year_slider[0]) &
-    (df['release_year'] <= year_slider[1])
-]
+types, ratings, years = sidebar_filters()
+
+filtered_df = get_filtered_df(types, ratings, years)
 
 if filtered_df.empty:
     st.warning("No data found for the selected filters. Please adjust your filter settings.")
 else:
-    
+
     #Main Page
-    
-    #Key Metrics 
+
+    #Key Metrics
     st.subheader("High-Level Summary")
+    # One value_counts pass covers both metrics - no per-type equality
+    # filter and row selection just to take a length.
     total_titles = filtered_df.shape[0]
-    total_movies = filtered_df[filtered_df['type'] == 'Movie'].shape[0]
-    total_shows = filtered_df[filtered_df['type'] == 'TV Show'].shape[0]
+    type_counts = filtered_df['type'].value_counts()
+    total_movies = int(type_counts.get('Movie', 0))
+    total_shows = int(type_counts.get('TV Show', 0))
 
     col1, col2, col3 = st.columns(3)
     col1.metric("Total Titles", f"{total_titles:,}")
@@ -89,141 +273,29 @@ else:
     col_chart1, col_chart2 = st.columns(2)
 
     with col_chart1:
-        # Plot 1
-        st.markdown("**Plot 1: Top 10 Genres by Rating**")
-        
-        genre_df = filtered_df.dropna(subset=['listed_in', 'rating'])
-        genre_df['main_genre'] = genre_df['listed_in'].str.split(', ').str[0]
-        
-        top_10_genres = genre_df['main_genre'].value_counts().head(10).index.tolist()
-        top_genres_df = genre_df[genre_df['main_genre'].isin(top_10_genres)]
-        
-        genre_rating_counts = top_genres_df.groupby(['main_genre', 'rating']).size().reset_index(name='count')
-
-        if not genre_rating_counts.empty:
-            fig1 = px.bar(
-                genre_rating_counts,
-                x='main_genre',
-                y='count',
-                color='rating',
-                title="Rating Breakdown for Top 10 Genres",
-                barmode='stack'
-            )
-            fig1.update_layout(xaxis_title="Genre", yaxis_title="Total Count",
-                               xaxis={'categoryorder':'total descending'})
-            st.plotly_chart(fig1, use_container_width=True)
-        else:
-            st.info("No data for Genre/Rating chart.")
-
+        chart_top_genres(types, ratings, years)
 
     with col_chart2:
-        # Plot 2
-        st.markdown("**Plot 2: Content Addition Heatmap (by Year & Month)**")
-        heatmap_data = filtered_df.copy()
-        heatmap_data['month_added'] = heatmap_data['date_added'].dt.month_name()
-        heatmap_data['year_added'] = heatmap_data['date_added'].dt.year
-        
-        heatmap_grouped = heatmap_data.groupby(['year_added', 'month_added']).size().reset_index(name='count')
-        
-        month_order = list(calendar.month_name)[1:]
-        heatmap_grouped['month_added'] = pd.Categorical(heatmap_grouped['month_added'], categories=month_order, ordered=True)
-        heatmap_grouped = heatmap_grouped.sort_values(by='month_added')
-        
-        heatmap_pivot = heatmap_grouped.pivot(index='year_added', columns='month_added', values='count').fillna(0)
-
-        if not heatmap_pivot.empty:
-            fig2 = go.Figure(data=go.Heatmap(
-                z=heatmap_pivot.values,
-                x=heatmap_pivot.columns,
-                y=heatmap_pivot.index,
-                colorscale='Reds'
-            ))
-            fig2.update_layout(title="Monthly Content Additions Over Time",
-                               xaxis_title="Month",
-                               yaxis_title="Year")
-            st.plotly_chart(fig2, use_container_width=True)
-        else:
-            st.info("No data for Heatmap.")
+        chart_heatmap(types, ratings, years)
 
 
     st.subheader("Geographic & Rating Analysis")
     col_chart3, col_chart4 = st.columns(2)
 
     with col_chart3:
-        # Plot 3
-        st.markdown("**Plot 3: Top 10 Production Countries (Excl. USA)**")
-        country_data = filtered_df[filtered_df['country'] != 'Unknown']['country'].str.split(', ').explode()
-        
-        country_data_no_usa = country_data[country_data != 'United States']
-        
-        if not country_data_no_usa.empty:
-            country_counts = country_data_no_usa.value_counts().head(10).reset_index()
-            country_counts.columns = ['Country', 'Count']
-            
-            fig3 = px.bar(
-                country_counts,
-                x='Count',
-                y='Country',
-                orientation='h',
-                title="Top 10 Production Countries (Excluding United States)"
-            )
-            fig3.update_layout(yaxis={'categoryorder':'total ascending'})
-            st.plotly_chart(fig3, use_container_width=True)
-        else:
-            st.info("No non-USA country data to display.")
+        chart_top_countries(types, ratings, years)
 
     with col_chart4:
-        #Plot 4
-        st.markdown("**Plot 4: Overall Rating Distribution**")
-        
-        rating_counts = filtered_df['rating'].value_counts().reset_index()
-        rating_counts.columns = ['rating', 'count']
-
-        if not rating_counts.empty:
-            fig4 = px.pie(
-                rating_counts,
-                names='rating',
-                values='count',
-                title="Overall Rating Distribution",
-                hole=0.3
-            )
-            st.plotly_chart(fig4, use_container_width=True)
-        else:
-            st.info("No rating data to display.")
-
+        chart_rating_distribution(types, ratings, years)
 
 
     st.subheader("Movie Runtime Analysis")
-    
-    # Plot 5
-    st.markdown("**Plot 5: Movie Runtime Distribution by Genre**")
-    
-    box_data = filtered_df[
-        (filtered_df['type'] == 'Movie') & 
-        (filtered_df['duration'].str.contains(' min', na=False))
-    ].copy()
-    box_data = box_data.dropna(subset=['listed_in'])
-    
-    if not box_data.empty:
-        box_data['duration_int'] = box_data['duration'].str.replace(' min', '').astype(int)
-        box_data['main_genre'] = box_data['listed_in'].str.split(', ').str[0]
-        
-        # Get top 10 genres
-        top_10_genres_box = box_data['main_genre'].value_counts().head(10).index.tolist()
-        box_data_top_10 = box_data[box_data['main_genre'].isin(top_10_genres_box)]
-
-        fig5 = px.box(
-            box_data_top_10,
-            x='main_genre',
-            y='duration_int',
-            title="Movie Runtime Distributions by Top 10 Genres",
-        )
-        fig5.update_layout(xaxis_title="Genre", yaxis_title="Duration (Minutes)")
-        st.plotly_chart(fig5, use_container_width=True)
-    else:
-        st.info("No valid movie runtime data to display.")
+    chart_runtime_box(types, ratings, years)
 
 
     # Raw Data Table
     st.subheader("Explore All Filtered Titles")
-    st.dataframe(filtered_df)
+    # Only send the columns the table actually shows - skipping the full
+    # description blob and other unused columns cuts the websocket payload.
+    display_cols = ['title', 'type', 'rating', 'release_year', 'main_genre', 'country']
+    st.dataframe(filtered_df[display_cols], use_container_width=True, height=400)
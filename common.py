@@ -0,0 +1,132 @@
+import streamlit as st
+import numpy as np
+import pandas as pd
+import numexpr as ne
+from pathlib import Path
+
+
+DATA_PATH = 'netflix_titles.csv'
+
+#Data Loading
+@st.cache_data
+def load_data(filepath=DATA_PATH):
+    if not Path(filepath).exists():
+        st.error(f"Error: The file '{filepath}' was not found. Please make sure it's in the root of your GitHub repository.")
+        return {'data': pd.DataFrame(), 'countries_long': pd.DataFrame(),
+                'meta': {'min_year': 0, 'max_year': 0, 'types': [], 'ratings': []}}
+
+    # The pyarrow engine parses the CSV in one multithreaded pass and the
+    # pyarrow backend keeps string columns in Arrow buffers, which speeds up
+    # the .str split/extract work below.
+    data = pd.read_csv(filepath, engine='pyarrow', dtype_backend='pyarrow')
+    # Data Cleaning
+    data['country'] = data['country'].fillna('Unknown')
+    data['director'] = data['director'].fillna('Unknown')
+    data['cast'] = data['cast'].fillna('Unknown')
+    data = data.dropna(subset=['rating', 'date_added', 'duration'])
+
+    # Convert date_added to datetime objects for time-based plots. The CSV
+    # uses written-out dates ('September 25, 2021') that Arrow's timestamp
+    # parser doesn't handle, so this stays a separate pass.
+    data['date_added'] = pd.to_datetime(data['date_added'], format='mixed')
+
+    # Parse the derived columns once here instead of re-running string
+    # and datetime ops inside the chart code on every rerun.
+    data['duration_min'] = pd.to_numeric(
+        data['duration'].str.extract(r'(?P<n>\d+)\s*min', expand=False), errors='coerce'
+    ).astype('Int32')
+    data['season_count'] = pd.to_numeric(
+        data['duration'].str.extract(r'(?P<n>\d+)\s*Season', expand=False), errors='coerce'
+    ).astype('Int32')
+    data['month_added'] = data['date_added'].dt.month.astype('int8')
+    data['year_added'] = data['date_added'].dt.year.astype('int16')
+
+    # First listed genre, via partition rather than split: no per-row list
+    # allocation, just the text before the first comma.
+    data['main_genre'] = data['listed_in'].str.partition(', ')[0]
+
+    # type and rating are low-cardinality: category dtype stores them as
+    # small integer codes, so isin/value_counts/groupby compare codes
+    # instead of Python strings. country/listed_in stay as strings since
+    # they get split + exploded.
+    for col in ('type', 'rating'):
+        data[col] = data[col].astype('category')
+
+    # Keep the frame sorted by release_year (with a fresh 0..N-1 index, so
+    # the long tables below still line up positionally): the year-slider
+    # filter can then bound the range with two binary searches instead of
+    # scanning the whole column.
+    data = data.sort_values('release_year', kind='stable').reset_index(drop=True)
+
+    # Pre-explode the comma-separated country column into a long table
+    # once at load time. It keeps the original row index, so chart code
+    # can narrow it to the filtered rows with index.isin() instead of
+    # re-running the split + explode on every rerun.
+    countries_long = data['country'].str.split(', ').explode().rename('country').to_frame()
+
+    # Widget metadata (filter options and slider bounds), computed once here
+    # so the sidebar doesn't rescan full columns on every rerun.
+    meta = {
+        'min_year': int(data['release_year'].min()),
+        'max_year': int(data['release_year'].max()),
+        'types': data['type'].cat.categories.tolist(),
+        'ratings': data['rating'].cat.categories.tolist(),
+    }
+    return {'data': data, 'countries_long': countries_long, 'meta': meta}
+
+@st.cache_data
+def get_filter_arrays(data):
+    # Raw ndarrays for the sidebar filters, pulled out of the DataFrame once
+    # so the per-rerun mask building stays at NumPy level.
+    return (
+        data['type'].to_numpy(),
+        data['rating'].to_numpy(),
+        data['release_year'].to_numpy(),
+    )
+
+def sidebar_filters():
+    # Shared sidebar: renders the filter widgets and returns the selection
+    # as sorted tuples, so every page keys its caches the same way.
+    meta = load_data()['meta']
+
+    st.sidebar.header("Dashboard Filters")
+
+    # Filter 1
+    type_filter = st.sidebar.multiselect(
+        "Select Content Type (Movie/TV Show):",
+        options=meta['types'],
+        default=meta['types']
+    )
+
+    # Filter 2
+    rating_filter = st.sidebar.multiselect(
+        "Select Content Rating:",
+        options=meta['ratings'],
+        default=meta['ratings']
+    )
+
+    # Filter 3
+    year_slider = st.sidebar.slider(
+        "Select Release Year Range:",
+        min_value=meta['min_year'],
+        max_value=meta['max_year'],
+        value=(meta['min_year'], meta['max_year'])
+    )
+
+    # Sorted tuples so the cache key is stable regardless of click order.
+    return tuple(sorted(type_filter)), tuple(sorted(rating_filter)), year_slider
+
+@st.cache_data
+def get_filtered_df(types, ratings, years):
+    df = load_data()['data']
+    type_arr, rating_arr, year_arr = get_filter_arrays(df)
+
+    # release_year is sorted at load time, so two binary searches bound the
+    # slider range and the isin masks only run over that slice; numexpr
+    # fuses the boolean combine without intermediate mask arrays.
+    y0, y1 = years
+    lo, hi = np.searchsorted(year_arr, [y0, y1 + 1])
+    type_mask = np.isin(type_arr[lo:hi], types)
+    rating_mask = np.isin(rating_arr[lo:hi], ratings)
+    filter_mask = ne.evaluate('type_mask & rating_mask')
+    return df.iloc[lo:hi].iloc[filter_mask]